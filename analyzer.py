@@ -1,17 +1,110 @@
 """Video analyzer using Gemini API."""
+import asyncio
 import logging
-import json
+import orjson
 import time
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from collections import deque
-from google import genai
-from google.genai import types
 import config
 
 logger = logging.getLogger(__name__)
 
+# Prompt for the comprehensive blog-style guide (built once at import, not per call).
+# The JSON structure is enforced by the response schema, so this only sets style.
+_BLOG_PROMPT = """Analyze this video and write a detailed blog-post-style guide that lets the reader recreate the entire workflow shown.
+
+Style:
+- title: a clear, compelling promise; subtitle: one sentence expanding on it
+- introduction: a hook naming the reader's problem, then "By the end of this guide, you will know exactly how to..."
+- steps: each starts with a "### Step N: ..." header and has 4-8+ sentences, using numbered lists for sequential actions, bullets, > blockquotes for key insights, **bold** keywords, `code` for commands and paths, and timestamps like **At 1:25**
+- capture exact button labels, menu names, values, error messages and keyboard shortcuts, and explain why each action is taken
+- conclusion: starts with "## Conclusion: Your Next Move", summarizes the benefit and ends with a question
+Write conversationally, addressing the reader as "you". Aim for 1500+ words in total."""
+
+# Prepended to _BLOG_PROMPT when several videos are analyzed in one request
+_BATCH_PROMPT_HEADER = """You are given {count} videos, attached in order. Return exactly {count} guides in "results", one per video and in the same order, each following the instructions below.
+
+"""
+
+# Upload polling: start fast, back off to a 2s cap, give up after 2 minutes
+_ACTIVE_MAX_WAIT = 120
+_ACTIVE_POLL_START = 0.1
+_ACTIVE_POLL_CAP = 2.0
+
+
+def _active_poll_delays():
+    """
+    Yield the sleeps between upload state checks, then raise TimeoutError.
+
+    Shared by the sync and async upload paths so only the sleep differs.
+    """
+    delay = _ACTIVE_POLL_START
+    elapsed = 0.0
+    while elapsed < _ACTIVE_MAX_WAIT:
+        yield delay
+        elapsed += delay
+        delay = min(delay * 2, _ACTIVE_POLL_CAP)
+    raise TimeoutError(f"File processing timeout after {_ACTIVE_MAX_WAIT}s")
+
+
+def _parse_guide_response(response) -> dict:
+    """Decode a single-guide JSON-mode response and log what it contains."""
+    # JSON mode returns a raw JSON body matching the schema
+    result = orjson.loads(response.text)
+    logger.info("Analysis completed successfully")
+
+    logger.info("Extracted %d steps from video", len(result['steps']))
+    return result
+
+
+def _build_response_configs(types):
+    """
+    Build the JSON-mode generation configs for single and batch requests.
+
+    Args:
+        types: The google.genai.types module
+
+    Returns:
+        Tuple of (single-guide config, batch config)
+    """
+    # Structure of one guide, enforced by Gemini's JSON mode
+    guide_schema = types.Schema(
+        type=types.Type.OBJECT,
+        properties={
+            "title": types.Schema(type=types.Type.STRING),
+            "subtitle": types.Schema(type=types.Type.STRING),
+            "introduction": types.Schema(type=types.Type.STRING),
+            "steps": types.Schema(
+                type=types.Type.ARRAY,
+                items=types.Schema(type=types.Type.STRING),
+                min_items=1,
+            ),
+            "conclusion": types.Schema(type=types.Type.STRING),
+        },
+        required=["title", "subtitle", "introduction", "steps", "conclusion"],
+    )
+
+    guide_config = types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_schema=guide_schema,
+    )
+
+    batch_config = types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_schema=types.Schema(
+            type=types.Type.OBJECT,
+            properties={
+                "results": types.Schema(type=types.Type.ARRAY, items=guide_schema),
+            },
+            required=["results"],
+        ),
+    )
+
+    return guide_config, batch_config
+
 
 class VideoAnalyzer:
     """Analyzes videos using Gemini API to extract step-by-step instructions."""
@@ -22,92 +115,117 @@ class VideoAnalyzer:
             raise ValueError(
                 "GEMINI_API_KEY not found. Please set it in .env file or environment."
             )
-        self.client = genai.Client(api_key=config.GEMINI_API_KEY)
 
-        # Rate limiting tracking
+        # Imported here rather than at module level: google.genai pulls in
+        # grpc, protobuf and auth libraries that CLI startup doesn't need
+        from google import genai
+        from google.genai import types
+        self._genai = genai
+        self.client = self._genai.Client(api_key=config.GEMINI_API_KEY)
+        self._guide_config, self._batch_config = _build_response_configs(types)
+
+        # Rate limiting tracking (monotonic clock, immune to wall-clock jumps;
+        # wall-clock time is only used for the daily Pacific midnight reset)
         self.request_timestamps = deque(maxlen=config.MAX_REQUESTS_PER_MINUTE)
         self.daily_requests = 0
-        self.last_request_time = 0
+        self.last_request_time = 0.0
+        self._rate_lock = threading.Lock()  # Shared by concurrent analyze_video() callers
 
         # Calculate next midnight Pacific Time (API quota resets at midnight PT)
-        pacific_tz = ZoneInfo("America/Los_Angeles")
-        now_pt = datetime.now(pacific_tz)
+        self._pacific_tz = ZoneInfo("America/Los_Angeles")
+        now_pt = datetime.now(self._pacific_tz)
         next_midnight_pt = (now_pt + timedelta(days=1)).replace(
             hour=0, minute=0, second=0, microsecond=0
         )
         self.daily_reset_time = next_midnight_pt
 
-        logger.info(f"VideoAnalyzer initialized with model: {config.GEMINI_MODEL}")
-        logger.info(f"Rate limits: {config.MAX_REQUESTS_PER_MINUTE} RPM, {config.MAX_REQUESTS_PER_DAY} RPD")
-        logger.info(f"Daily quota resets at: {next_midnight_pt.strftime('%Y-%m-%d %H:%M %Z')} (Pacific Time)")
+        logger.info("VideoAnalyzer initialized with model: %s", config.GEMINI_MODEL)
+        logger.info("Rate limits: %d RPM, %d RPD", config.MAX_REQUESTS_PER_MINUTE, config.MAX_REQUESTS_PER_DAY)
+        logger.info("Daily quota resets at: %s (Pacific Time)", next_midnight_pt.strftime('%Y-%m-%d %H:%M %Z'))
 
     def _check_rate_limit(self):
         """
         Check and enforce rate limits before making API requests.
-        Waits if necessary to stay within limits.
+        Waits if necessary to stay within limits. Thread-safe: concurrent
+        callers each reserve their own slot and wait for it in parallel.
         """
-        now = time.time()
-        pacific_tz = ZoneInfo("America/Los_Angeles")
-        current_time = datetime.now(pacific_tz)
-
-        # Reset daily counter if needed (at midnight Pacific Time)
-        if current_time >= self.daily_reset_time:
-            logger.info("Daily rate limit reset (midnight Pacific Time)")
-            self.daily_requests = 0
-            # Calculate next midnight PT
-            next_midnight_pt = (current_time + timedelta(days=1)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            self.daily_reset_time = next_midnight_pt
-
-        # Check daily limit
-        if self.daily_requests >= config.MAX_REQUESTS_PER_DAY:
-            wait_seconds = (self.daily_reset_time - current_time).total_seconds()
-            logger.warning(
-                f"Daily rate limit reached ({config.MAX_REQUESTS_PER_DAY} requests). "
-                f"Waiting {wait_seconds/3600:.1f} hours until midnight Pacific Time."
-            )
-            time.sleep(wait_seconds)
-            self.daily_requests = 0
-            # Recalculate next midnight PT after sleep
-            current_time = datetime.now(pacific_tz)
-            next_midnight_pt = (current_time + timedelta(days=1)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            self.daily_reset_time = next_midnight_pt
-
-        # Enforce minimum interval between requests
-        time_since_last = now - self.last_request_time
-        if time_since_last < config.MIN_REQUEST_INTERVAL:
-            wait_time = config.MIN_REQUEST_INTERVAL - time_since_last
-            logger.info(f"Rate limiting: waiting {wait_time:.1f}s before next request")
+        wait_time = self._reserve_request_slot()
+        if wait_time > 0:
             time.sleep(wait_time)
-            now = time.time()
 
-        # Track request in sliding window (per-minute limit)
-        current_minute = now // 60
-        self.request_timestamps = deque(
-            [ts for ts in self.request_timestamps if ts // 60 == current_minute],
-            maxlen=config.MAX_REQUESTS_PER_MINUTE
-        )
+    async def _check_rate_limit_async(self):
+        """Async variant of _check_rate_limit; waits without blocking the event loop."""
+        wait_time = self._reserve_request_slot()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
 
-        if len(self.request_timestamps) >= config.MAX_REQUESTS_PER_MINUTE:
-            oldest = self.request_timestamps[0]
-            wait_time = 60 - (now - (oldest // 60 * 60))
-            if wait_time > 0:
-                logger.warning(f"Per-minute rate limit reached. Waiting {wait_time:.1f}s")
-                time.sleep(wait_time)
-                now = time.time()
-
-        # Record this request
-        self.request_timestamps.append(now)
-        self.daily_requests += 1
-        self.last_request_time = now
-
-        logger.info(
-            f"Rate limit status: {self.daily_requests}/{config.MAX_REQUESTS_PER_DAY} daily, "
-            f"{len(self.request_timestamps)}/{config.MAX_REQUESTS_PER_MINUTE} per minute"
-        )
+    def _reserve_request_slot(self) -> float:
+        """
+        Reserve the earliest request slot allowed by the rate limits.
+
+        The lock is only held while the slot is computed and recorded, never
+        while waiting for it, so callers don't queue up behind a sleeper.
+
+        Returns:
+            Seconds the caller must wait before making its request
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = now
+            current_time = datetime.now(self._pacific_tz)
+
+            # Reset daily counter if needed (at midnight Pacific Time)
+            if current_time >= self.daily_reset_time:
+                logger.info("Daily rate limit reset (midnight Pacific Time)")
+                self.daily_requests = 0
+                # Calculate next midnight PT
+                next_midnight_pt = (current_time + timedelta(days=1)).replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                )
+                self.daily_reset_time = next_midnight_pt
+
+            # Check daily limit - push the slot past the next reset
+            if self.daily_requests >= config.MAX_REQUESTS_PER_DAY:
+                wait_seconds = (self.daily_reset_time - current_time).total_seconds()
+                logger.warning(
+                    "Daily rate limit reached (%d requests). "
+                    "Waiting %.1f hours until midnight Pacific Time.",
+                    config.MAX_REQUESTS_PER_DAY, wait_seconds / 3600
+                )
+                slot = now + wait_seconds
+                self.daily_requests = 0
+                # The slot falls in the next quota day, which resets at the following midnight
+                next_midnight_pt = (self.daily_reset_time + timedelta(days=1)).replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                )
+                self.daily_reset_time = next_midnight_pt
+
+            # Enforce minimum interval between requests
+            earliest = self.last_request_time + config.MIN_REQUEST_INTERVAL
+            if slot < earliest:
+                logger.info("Rate limiting: waiting %.1fs before next request", earliest - now)
+                slot = earliest
+
+            # Track request in sliding window (per-minute limit)
+            while self.request_timestamps and slot - self.request_timestamps[0] >= 60:
+                self.request_timestamps.popleft()
+
+            if len(self.request_timestamps) >= config.MAX_REQUESTS_PER_MINUTE:
+                slot = self.request_timestamps[0] + 60.0
+                logger.warning("Per-minute rate limit reached. Waiting %.1fs", slot - now)
+
+            # Record this request (maxlen drops the timestamp that just expired)
+            self.request_timestamps.append(slot)
+            self.daily_requests += 1
+            self.last_request_time = slot
+
+            logger.info(
+                "Rate limit status: %d/%d daily, %d/%d per minute",
+                self.daily_requests, config.MAX_REQUESTS_PER_DAY,
+                len(self.request_timestamps), config.MAX_REQUESTS_PER_MINUTE
+            )
+
+            return slot - now
 
     def analyze_video(self, video_path: Path) -> dict:
         """
@@ -117,142 +235,207 @@ class VideoAnalyzer:
             video_path: Path to the video file
 
         Returns:
-            dict with keys: title, summary, steps
+            dict with keys: title, subtitle, introduction, steps, conclusion
 
         Raises:
             Exception: If video analysis fails
         """
-        logger.info(f"Starting analysis of: {video_path.name}")
+        logger.info("Starting analysis of: %s", video_path.name)
 
         try:
-            # Upload video file
-            logger.info(f"Uploading video to Gemini API...")
-            uploaded_file = self.client.files.upload(file=str(video_path))
-            logger.info(f"Video uploaded successfully: {uploaded_file.name}")
+            uploaded_file = self._upload_video(video_path)
+
+            # Check rate limits before making API request
+            self._check_rate_limit()
+
+            # Generate content with video and prompt
+            logger.info("Requesting analysis from Gemini...")
+            response = self.client.models.generate_content(
+                model=config.GEMINI_MODEL,
+                contents=[uploaded_file, _BLOG_PROMPT],
+                config=self._guide_config
+            )
+
+            return _parse_guide_response(response)
+
+        except Exception as e:
+            logger.error("Video analysis failed: %s", e)
+            raise
+        finally:
+            if 'uploaded_file' in locals():
+                self._delete_uploaded_file(uploaded_file)
 
+    def _upload_video(self, video_path: Path):
+        """
+        Upload a video and wait for Gemini to finish processing it.
+
+        Args:
+            video_path: Path to the video file
+
+        Returns:
+            The uploaded file, in ACTIVE state
+
+        Raises:
+            TimeoutError: If the file doesn't become ACTIVE in time
+        """
+        logger.info("Uploading video to Gemini API...")
+        uploaded_file = self.client.files.upload(file=str(video_path))
+        logger.info("Video uploaded successfully: %s", uploaded_file.name)
+
+        try:
             # Wait for file to be processed and become ACTIVE
-            max_wait = 120  # 2 minutes max
-            wait_time = 0
+            delays = _active_poll_delays()
             while uploaded_file.state.name != "ACTIVE":
-                if wait_time >= max_wait:
-                    raise TimeoutError(f"File processing timeout after {max_wait}s")
-                time.sleep(2)
-                wait_time += 2
+                time.sleep(next(delays))
                 uploaded_file = self.client.files.get(name=uploaded_file.name)
-                logger.debug(f"Waiting for file processing... State: {uploaded_file.state.name}")
-
-            logger.info(f"File is ACTIVE and ready for analysis")
-
-            # Create prompt for comprehensive blog-style guide
-            prompt = """Analyze this video and create a comprehensive, detailed blog-post-style guide following this EXACT structure in JSON format:
-
-{
-  "title": "Your Main Title: A Clear, Compelling Promise",
-  "subtitle": "A subtitle that expands on the value you are providing the reader",
-  "introduction": "Start with a strong hook that identifies a common problem or question your reader has (2-3 sentences). Then clearly promise the outcome: 'By the end of this guide, you will know exactly how to [do the thing] so you can [achieve the benefit].'",
-  "steps": [
-    "### Step 1: The First Major Point or Action\n\nThis is where you explain the first step using clear, simple language. Keep paragraphs short (2-3 sentences) to make them easy to read on a screen.\n\nUse **bolding** to emphasize the most important **keywords** or **concepts** that you want your reader to remember.\n\n**A. A Key Sub-Point or Action**\n\nIf a step is complex, break it down using sub-headings with lettered points:\n\n- Here is one item to consider.\n- Here is a second item to consider.\n- And a third important detail.\n\n**At 0:45** in the video, you can see [describe what happens at this timestamp].",
-
-    "### Step 2: Moving on to the Next Phase\n\nIntroduce the next part of the process with context.\n\nFor sequential actions within a step, use numbered lists:\n\n1. First, perform this action by [specific details].\n2. Next, configure the [setting/option] to [value].\n3. Then, click on [button/element] located at [position].\n4. Finally, verify that [expected result] appears.\n\n> This is a blockquote. Use it to highlight a **key takeaway** or a powerful insight that you really want to stand out.\n\n**At 2:15**, the terminal displays [describe output]. This indicates [explain significance].",
-
-    "### Step 3: Putting It All Together\n\nHere, you might summarize the process or add a final crucial step that ties everything together.\n\n**Key points to remember:**\n- Point one with specific details\n- Point two with technical specifics\n- Point three with best practices\n\n> **Pro Tip:** [Share an expert insight or time-saving trick discovered in the video]"
-  ],
-  "conclusion": "## Conclusion: Your Next Move\n\nSummarize the main benefit achieved. You now have a complete framework for [doing the thing shown in the video].\n\nThe most important takeaway is to [reiterate the single most critical message].\n\nWhat's the first [topic/project] you're going to apply this to?"
-}
-
-CRITICAL INSTRUCTIONS FOR BLOG-POST FORMAT:
-
-**STRUCTURE:**
-- Title must be compelling and promise clear value
-- Subtitle expands on the promise (1 sentence)
-- Introduction MUST start with a hook identifying a problem, then promise the solution
-- Each step uses ### headers (not ##) with descriptive action-oriented titles
-- Conclusion summarizes benefits and includes a call-to-action question
-
-**CONTENT DEPTH:**
-- Each step should be 4-8 sentences minimum with rich detail
-- Include sub-points (A, B, C) for complex steps
-- Use numbered lists (1, 2, 3) for sequential actions within steps
-- Use bullet lists (-) for non-sequential items/considerations
-- Add blockquotes (>) for 2-3 key insights throughout the guide
-
-**FORMATTING:**
-- Use **bold** extensively for important keywords, tools, values, settings
-- Include `code formatting` for commands, file paths, technical terms
-- Add timing references: **At 1:25**, **Around the 3:00 mark**, etc.
-- Create visual hierarchy with headers, lists, and blockquotes
-
-**DETAIL REQUIREMENTS:**
-- Capture EXACT button labels, menu names, field values shown
-- Describe UI elements: "the blue 'Save' button in the top-right corner"
-- Include error messages verbatim with `monospace formatting`
-- Explain WHY each action is taken, not just WHAT
-- Describe visual feedback: loading spinners, success messages, state changes
-- Note any troubleshooting or problem-solving shown
-- Mention keyboard shortcuts used (e.g., Ctrl+S, Cmd+Enter)
-
-**ENGAGEMENT:**
-- Write conversationally as if teaching a friend
-- Use "you/your" to address the reader directly
-- Add context: "This step is crucial because..."
-- Include warnings: "⚠️ Be careful not to..."
-- Share insights: "Notice how the interface changes to show..."
-
-**COMPLETENESS:**
-- Someone should be able to recreate the ENTIRE workflow from your description
-- Include setup requirements if shown at the start
-- Note any prerequisites or dependencies mentioned
-- Describe the final state/outcome achieved
-
-Return ONLY valid JSON with no other text. Make this guide COMPREHENSIVE and DETAILED - aim for 1500+ words of content across all sections."""
+                logger.debug("Waiting for file processing... State: %s", uploaded_file.state.name)
+        except Exception:
+            self._delete_uploaded_file(uploaded_file)
+            raise
+
+        logger.info("File is ACTIVE and ready for analysis")
+        return uploaded_file
+
+    def _delete_uploaded_file(self, uploaded_file):
+        """Clean up an uploaded file from Gemini, logging any failure."""
+        try:
+            self.client.files.delete(name=uploaded_file.name)
+            logger.info("Cleaned up uploaded file from Gemini")
+        except Exception as e:
+            logger.warning("Failed to delete uploaded file: %s", e)
+
+    async def analyze_video_async(self, video_path: Path) -> dict:
+        """
+        Async variant of analyze_video using the client's aio interface.
+
+        Lets many videos be in flight on one event loop, e.g. when
+        reprocessing a backlog.
+
+        Args:
+            video_path: Path to the video file
+
+        Returns:
+            dict with keys: title, subtitle, introduction, steps, conclusion
+
+        Raises:
+            Exception: If video analysis fails
+        """
+        logger.info("Starting analysis of: %s", video_path.name)
+
+        try:
+            uploaded_file = await self._upload_video_async(video_path)
 
             # Check rate limits before making API request
-            self._check_rate_limit()
+            await self._check_rate_limit_async()
 
             # Generate content with video and prompt
             logger.info("Requesting analysis from Gemini...")
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=config.GEMINI_MODEL,
-                contents=[uploaded_file, prompt]
+                contents=[uploaded_file, _BLOG_PROMPT],
+                config=self._guide_config
             )
 
-            # Extract and parse response
-            result_text = response.text.strip()
-            logger.info("Analysis completed successfully")
+            return _parse_guide_response(response)
 
-            # Clean JSON from markdown code blocks if present
-            if result_text.startswith("```json"):
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif result_text.startswith("```"):
-                result_text = result_text.split("```")[1].split("```")[0].strip()
+        except Exception as e:
+            logger.error("Video analysis failed: %s", e)
+            raise
+        finally:
+            if 'uploaded_file' in locals():
+                await self._delete_uploaded_file_async(uploaded_file)
 
-            # Parse JSON response
-            result = json.loads(result_text)
+    async def analyze_videos_batch_async(self, video_paths: list[Path], batch_size: int = 4) -> list[dict]:
+        """
+        Analyze several videos, packing up to batch_size of them into each request.
 
-            # Validate required fields for new blog-post format
-            required_fields = ["title", "subtitle", "introduction", "steps", "conclusion"]
-            for field in required_fields:
-                if field not in result:
-                    raise ValueError(f"Missing required field: {field}")
+        Each batch is uploaded concurrently and analyzed with a single
+        generate_content call, so it counts as one request against the rate
+        limits. Suited to bulk reprocessing of many short recordings.
 
-            if not isinstance(result["steps"], list) or len(result["steps"]) == 0:
-                raise ValueError("Steps must be a non-empty list")
+        Args:
+            video_paths: Paths to the video files
+            batch_size: Maximum number of videos per Gemini request
 
-            logger.info(f"Extracted {len(result['steps'])} steps from video")
-            return result
+        Returns:
+            List of analysis dicts, in the same order as video_paths
+
+        Raises:
+            Exception: If analysis of any batch fails
+        """
+        results = []
+        for start in range(0, len(video_paths), batch_size):
+            results.extend(await self._analyze_batch_async(video_paths[start:start + batch_size]))
+        return results
+
+    async def _analyze_batch_async(self, video_paths: list[Path]) -> list[dict]:
+        """Analyze one batch of videos with a single Gemini request."""
+        logger.info("Starting batch analysis of %d videos: %s",
+                    len(video_paths), ", ".join(p.name for p in video_paths))
+
+        uploaded_files = []
+        try:
+            # Upload all videos concurrently, keeping them in input order
+            uploads = await asyncio.gather(
+                *(self._upload_video_async(p) for p in video_paths),
+                return_exceptions=True
+            )
+            uploaded_files = [u for u in uploads if not isinstance(u, BaseException)]
+            errors = [u for u in uploads if isinstance(u, BaseException)]
+            if errors:
+                raise errors[0]
+
+            # One request for the whole batch
+            await self._check_rate_limit_async()
+
+            logger.info("Requesting batch analysis from Gemini...")
+            prompt = _BATCH_PROMPT_HEADER.format(count=len(uploaded_files)) + _BLOG_PROMPT
+            response = await self.client.aio.models.generate_content(
+                model=config.GEMINI_MODEL,
+                contents=[*uploaded_files, prompt],
+                config=self._batch_config
+            )
+
+            results = orjson.loads(response.text)["results"]
+            logger.info("Batch analysis completed successfully")
+
+            if len(results) != len(video_paths):
+                raise ValueError(f"Expected {len(video_paths)} results, got {len(results)}")
+            for video_path, result in zip(video_paths, results):
+                logger.info("Extracted %d steps from %s", len(result['steps']), video_path.name)
+
+            return results
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.error(f"Response was: {result_text[:500]}")
-            raise Exception(f"Invalid JSON response from Gemini: {e}")
         except Exception as e:
-            logger.error(f"Video analysis failed: {e}")
+            logger.error("Batch analysis failed: %s", e)
             raise
         finally:
-            # Clean up uploaded file
-            try:
-                if 'uploaded_file' in locals():
-                    self.client.files.delete(name=uploaded_file.name)
-                    logger.info("Cleaned up uploaded file from Gemini")
-            except Exception as e:
-                logger.warning(f"Failed to delete uploaded file: {e}")
+            await asyncio.gather(*(self._delete_uploaded_file_async(f) for f in uploaded_files))
+
+    async def _upload_video_async(self, video_path: Path):
+        """Async variant of _upload_video."""
+        logger.info("Uploading video to Gemini API...")
+        uploaded_file = await self.client.aio.files.upload(file=str(video_path))
+        logger.info("Video uploaded successfully: %s", uploaded_file.name)
+
+        try:
+            # Wait for file to be processed and become ACTIVE
+            delays = _active_poll_delays()
+            while uploaded_file.state.name != "ACTIVE":
+                await asyncio.sleep(next(delays))
+                uploaded_file = await self.client.aio.files.get(name=uploaded_file.name)
+                logger.debug("Waiting for file processing... State: %s", uploaded_file.state.name)
+        except BaseException:
+            await self._delete_uploaded_file_async(uploaded_file)
+            raise
+
+        logger.info("File is ACTIVE and ready for analysis")
+        return uploaded_file
+
+    async def _delete_uploaded_file_async(self, uploaded_file):
+        """Async variant of _delete_uploaded_file."""
+        try:
+            await self.client.aio.files.delete(name=uploaded_file.name)
+            logger.info("Cleaned up uploaded file from Gemini")
+        except Exception as e:
+            logger.warning("Failed to delete uploaded file: %s", e)
@@ -4,6 +4,13 @@ import logging
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
+
+# Load environment variables BEFORE importing config
+load_dotenv()
+
+# The analyzer modules live in the repository root, shared with process_existing.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
 import config
 from analyzer import VideoAnalyzer
 from markdown_generator import MarkdownGenerator
@@ -14,7 +21,8 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler(config.BASE_DIR / 'screenpulse-analyzer.log')
+        # Next to this script, where screenpulse-analyzer.service sends its output
+        logging.FileHandler(Path(__file__).resolve().parent / 'screenpulse-analyzer.log')
     ]
 )
 
@@ -53,7 +61,6 @@ class ScreenPulseAnalyzer:
 
 
 if __name__ == "__main__":
-    load_dotenv()
     if not config.GEMINI_API_KEY:
         logger.error("GEMINI_API_KEY not found!")
         sys.exit(1)
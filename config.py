@@ -13,13 +13,24 @@ VIDEOS_DIR = Path(os.getenv("SCREENPULSE_VIDEOS_DIR", "/mnt/Recordings"))
 SAVE_MD_WITH_VIDEO = True  # If True, MD files go in same folder as video
 SUMMARIES_DIR = Path(os.getenv("SCREENPULSE_SUMMARIES_DIR", BASE_DIR / "summaries"))
 
-# Ensure directories exist
-VIDEOS_DIR.mkdir(exist_ok=True, parents=True)
-if not SAVE_MD_WITH_VIDEO:
-    SUMMARIES_DIR.mkdir(exist_ok=True, parents=True)
+
+def ensure_dirs():
+    """
+    Ensure the output directories exist.
+
+    Called from the entry points that write, rather than at import time, so
+    importing config doesn't cost a mkdir round-trip on network mounts.
+    """
+    if not VIDEOS_DIR.exists():
+        VIDEOS_DIR.mkdir(parents=True, exist_ok=True)
+    if not SAVE_MD_WITH_VIDEO and not SUMMARIES_DIR.exists():
+        SUMMARIES_DIR.mkdir(parents=True, exist_ok=True)
+
 
 # Supported video formats
 SUPPORTED_FORMATS = {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv', '.m4v'}
+# Lower-case suffixes for a raw-path check: path.lower().endswith(SUPPORTED_SUFFIXES_TUPLE)
+SUPPORTED_SUFFIXES_TUPLE = tuple(ext.lower() for ext in SUPPORTED_FORMATS)
 
 # Gemini API settings
 GEMINI_MODEL = "gemini-2.0-flash-lite"  # Fastest model: 30 RPM, 200 RPD free tier
@@ -13,8 +13,7 @@ class MarkdownGenerator:
 
     def __init__(self):
         """Initialize the markdown generator."""
-        if not config.SAVE_MD_WITH_VIDEO:
-            config.SUMMARIES_DIR.mkdir(exist_ok=True)
+        config.ensure_dirs()
 
     def generate(self, analysis_result: dict, video_path: Path) -> Path:
         """
@@ -33,16 +32,14 @@ class MarkdownGenerator:
         steps = analysis_result["steps"]
         conclusion = analysis_result["conclusion"]
 
-        # Generate safe filename from title
+        # Generate safe filename from title; the video stem keeps summaries of
+        # videos analysed in the same second (one batch) from sharing a name
         safe_filename = self._sanitize_filename(title)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        md_filename = f"{timestamp}_{safe_filename}.md"
+        md_stem = f"{timestamp}_{video_path.stem}_{safe_filename}"
 
         # Save in same directory as video or in summaries folder
-        if config.SAVE_MD_WITH_VIDEO:
-            md_path = video_path.parent / md_filename
-        else:
-            md_path = config.SUMMARIES_DIR / md_filename
+        md_dir = video_path.parent if config.SAVE_MD_WITH_VIDEO else config.SUMMARIES_DIR
 
         # Generate markdown content with blog-post structure
         current_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -82,8 +79,17 @@ class MarkdownGenerator:
 *⏰ Created on {current_date}*
 """
 
-        # Write to file
-        md_path.write_text(markdown_content, encoding='utf-8')
+        # Write to file, never replacing an existing summary
+        md_path = md_dir / f"{md_stem}.md"
+        counter = 1
+        while True:
+            try:
+                with md_path.open('x', encoding='utf-8') as f:
+                    f.write(markdown_content)
+                break
+            except FileExistsError:
+                counter += 1
+                md_path = md_dir / f"{md_stem}_{counter}.md"
         logger.info(f"Created markdown file: {md_path.name}")
 
         return md_path
@@ -4,8 +4,10 @@ Process existing videos that were not analyzed due to timeout issues.
 This script will find all videos without corresponding .md files and process them.
 """
 import logging
+import os
 import sys
 import argparse
+import asyncio
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -30,51 +32,99 @@ def find_unprocessed_videos():
     """Find videos that don't have corresponding .md files."""
     unprocessed = []
 
-    for video_path in config.VIDEOS_DIR.glob("*"):
-        if video_path.suffix.lower() in config.SUPPORTED_FORMATS:
-            # Generate expected markdown filename
-            md_filename = video_path.stem + ".md"
+    # Scan the directory once; DirEntry caches type and stat info
+    with os.scandir(config.VIDEOS_DIR) as it:
+        entries = list(it)
 
-            # Also check for timestamp-prefixed versions
-            md_files = list(config.VIDEOS_DIR.glob(f"*{video_path.stem.lower()}*.md"))
+    # Existing markdown stems, to match timestamp-prefixed versions too
+    md_stems = {entry.name[:-3].lower() for entry in entries if entry.name.endswith(".md")}
 
-            if not md_files:
-                unprocessed.append(video_path)
-                logger.info(f"Found unprocessed: {video_path.name} ({video_path.stat().st_size / 1024 / 1024:.1f} MB)")
+    for entry in entries:
+        if entry.name.lower().endswith(config.SUPPORTED_SUFFIXES_TUPLE) and entry.is_file():
+            stem = os.path.splitext(entry.name)[0].lower()
+            if not any(stem in md_stem for md_stem in md_stems):
+                unprocessed.append(Path(entry.path))
+                logger.info("Found unprocessed: %s (%.1f MB)", entry.name, entry.stat().st_size / 1024 / 1024)
 
     return unprocessed
 
 
-def process_video(video_path: Path, analyzer: VideoAnalyzer, markdown_gen: MarkdownGenerator):
+async def process_video(video_path: Path, analyzer: VideoAnalyzer, markdown_gen: MarkdownGenerator):
     """Process a single video."""
-    logger.info(f"\nProcessing: {video_path.name}")
-    logger.info(f"Size: {video_path.stat().st_size / 1024 / 1024:.1f} MB")
+    logger.info("\nProcessing: %s", video_path.name)
+    logger.info("Size: %.1f MB", video_path.stat().st_size / 1024 / 1024)
 
     try:
         # Analyze video with Gemini
         logger.info("Analyzing video with Gemini AI...")
-        analysis_result = analyzer.analyze_video(video_path)
+        analysis_result = await analyzer.analyze_video_async(video_path)
 
         # Generate markdown file
         logger.info("Generating markdown summary...")
         md_path = markdown_gen.generate(analysis_result, video_path=video_path)
 
-        logger.info(f"✓ Success! Created: {md_path.name}")
-        logger.info(f"  Title: {analysis_result['title']}")
-        logger.info(f"  Steps: {len(analysis_result['steps'])}")
+        logger.info("✓ Success! Created: %s", md_path.name)
+        logger.info("  Title: %s", analysis_result['title'])
+        logger.info("  Steps: %d", len(analysis_result['steps']))
 
         return True
 
     except Exception as e:
-        logger.error(f"✗ Failed: {e}")
+        logger.error("✗ Failed: %s", e)
         return False
 
 
+async def process_batch(video_paths: list[Path], analyzer: VideoAnalyzer, markdown_gen: MarkdownGenerator) -> int:
+    """Process several videos with a single Gemini request. Returns the number processed."""
+    if len(video_paths) == 1:
+        return int(await process_video(video_paths[0], analyzer, markdown_gen))
+
+    logger.info("\nProcessing batch: %s", ', '.join(p.name for p in video_paths))
+
+    try:
+        logger.info("Analyzing videos with Gemini AI...")
+        results = await analyzer.analyze_videos_batch_async(video_paths, batch_size=len(video_paths))
+    except Exception as e:
+        logger.error("✗ Batch failed: %s", e)
+        return 0
+
+    success_count = 0
+    for video_path, analysis_result in zip(video_paths, results):
+        try:
+            md_path = markdown_gen.generate(analysis_result, video_path=video_path)
+            logger.info("✓ Success! Created: %s (from %s)", md_path.name, video_path.name)
+            success_count += 1
+        except Exception as e:
+            logger.error("✗ Failed to write summary for %s: %s", video_path.name, e)
+
+    return success_count
+
+
+async def process_all(batches: list[list[Path]], analyzer: VideoAnalyzer,
+                      markdown_gen: MarkdownGenerator, max_concurrent: int) -> int:
+    """Process all batches concurrently, at most max_concurrent at a time. Returns the number processed."""
+    semaphore = asyncio.Semaphore(max_concurrent)
+    total = sum(len(batch) for batch in batches)
+    done_count = 0
+
+    async def run(batch):
+        nonlocal done_count
+        async with semaphore:
+            succeeded = await process_batch(batch, analyzer, markdown_gen)
+        done_count += len(batch)
+        logger.info("Progress: %d/%d", done_count, total)
+        return succeeded
+
+    return sum(await asyncio.gather(*(run(batch) for batch in batches)))
+
+
 def main():
     """Main entry point."""
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Process unprocessed ScreenPulse videos")
     parser.add_argument("-y", "--yes", action="store_true", help="Skip confirmation prompt")
+    parser.add_argument("--batch-size", type=int, default=1,
+                        help="Videos analyzed per Gemini request (default: 1)")
     args = parser.parse_args()
 
     if not config.GEMINI_API_KEY:
@@ -86,15 +136,17 @@ def main():
     logger.info("ScreenPulse - Process Existing Videos")
     logger.info("=" * 60)
 
+    config.ensure_dirs()
+
     # Find unprocessed videos
-    logger.info(f"\nScanning: {config.VIDEOS_DIR}")
+    logger.info("\nScanning: %s", config.VIDEOS_DIR)
     unprocessed = find_unprocessed_videos()
 
     if not unprocessed:
         logger.info("\n✓ All videos have been processed!")
         return
 
-    logger.info(f"\nFound {len(unprocessed)} unprocessed video(s)")
+    logger.info("\nFound %d unprocessed video(s)", len(unprocessed))
 
     # Ask for confirmation unless --yes flag is used
     if not args.yes:
@@ -113,27 +165,24 @@ def main():
     analyzer = VideoAnalyzer()
     markdown_gen = MarkdownGenerator()
 
-    # Process each video
-    success_count = 0
-    fail_count = 0
+    # Process videos concurrently on one event loop - uploads and analysis are
+    # I/O-bound on Gemini's side, and the analyzer's rate limiter hands out request slots
+    max_concurrent = min(config.MAX_REQUESTS_PER_MINUTE, 8)
+    logger.info("Processing up to %d request(s) concurrently", max_concurrent)
 
-    for i, video_path in enumerate(unprocessed, 1):
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"Video {i}/{len(unprocessed)}")
-        logger.info(f"{'=' * 60}")
+    batch_size = max(args.batch_size, 1)
+    batches = [unprocessed[i:i + batch_size] for i in range(0, len(unprocessed), batch_size)]
 
-        if process_video(video_path, analyzer, markdown_gen):
-            success_count += 1
-        else:
-            fail_count += 1
+    success_count = asyncio.run(process_all(batches, analyzer, markdown_gen, max_concurrent))
+    fail_count = len(unprocessed) - success_count
 
     # Summary
-    logger.info(f"\n{'=' * 60}")
+    logger.info("\n%s", '=' * 60)
     logger.info("SUMMARY")
-    logger.info(f"{'=' * 60}")
-    logger.info(f"Successfully processed: {success_count}")
-    logger.info(f"Failed: {fail_count}")
-    logger.info(f"Total: {len(unprocessed)}")
+    logger.info("%s", '=' * 60)
+    logger.info("Successfully processed: %d", success_count)
+    logger.info("Failed: %d", fail_count)
+    logger.info("Total: %d", len(unprocessed))
 
 
 if __name__ == "__main__":
@@ -6,17 +6,99 @@ Records screen activity when mouse moves, stops after inactivity, and splits lon
 
 import subprocess
 import time
+import ctypes
+import fcntl
+import re
+import struct
 import os
 import logging
+import logging.handlers
+import queue
 from datetime import datetime
 from pathlib import Path
-from threading import Thread, Lock
 import evdev
+import pyudev
 import select
 import signal
 import sys
 import atexit
 
+# timerfd(2) via libc so timers can share the epoll set with input devices
+_CLOCK_MONOTONIC = 1
+_TFD_NONBLOCK = os.O_NONBLOCK
+_TFD_CLOEXEC = os.O_CLOEXEC
+
+_libc = ctypes.CDLL(None, use_errno=True)
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = [("it_interval", _Timespec), ("it_value", _Timespec)]
+
+
+def _timespec(seconds):
+    whole = int(seconds)
+    return _Timespec(whole, int((seconds - whole) * 1_000_000_000))
+
+
+def timerfd_create():
+    """Create a non-blocking CLOCK_MONOTONIC timerfd"""
+    fd = _libc.timerfd_create(_CLOCK_MONOTONIC, _TFD_NONBLOCK | _TFD_CLOEXEC)
+    if fd < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return fd
+
+
+def timerfd_settime(fd, initial, interval=0):
+    """Arm a timerfd to fire after `initial` seconds, then every `interval` (0 = once, initial 0 = disarm)"""
+    spec = _Itimerspec(_timespec(interval), _timespec(initial))
+    if _libc.timerfd_settime(fd, 0, ctypes.byref(spec), None) < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+
+
+# EVIOCSMASK = _IOW('E', 0x93, struct input_mask { __u32 type; __u32 codes_size; __u64 codes_ptr; })
+_EVIOCSMASK = 0x40104593
+
+
+def set_event_type_mask(device, event_types):
+    """Ask the kernel to deliver only the given event types on this fd.
+
+    EV_SYN cannot be masked, but SYN_REPORTs closing an otherwise empty
+    packet are dropped, so filtered-out reports no longer wake epoll.
+    """
+    mask = ctypes.c_uint64(sum(1 << t for t in event_types))
+    request = struct.pack('IIQ', 0, ctypes.sizeof(mask), ctypes.addressof(mask))
+    fcntl.ioctl(device.fd, _EVIOCSMASK, request)
+
+
+# ACPI/platform devices that report EV_KEY but never mean "user is active"
+_IGNORED_DEVICE_NAMES = re.compile(r'Video Bus|Power Button|Sleep Button|Lid Switch')
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the strftime() result for records in the same second"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = None
+        self._cached_time = ''
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(datefmt or self.default_time_format,
+                                              self.converter(second))
+            self._cached_second = second
+        if datefmt:
+            return self._cached_time
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
 class ScreenPulse:
     def __init__(self,
                  output_dir="recordings",
@@ -29,17 +111,30 @@ class ScreenPulse:
 
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Recording paths are built by plain string concatenation
+        self._out_prefix = str(self.output_dir.absolute()) + os.sep + 'recording_'
 
-        # Setup logging
+        # Setup logging: callers only enqueue records, a listener thread does
+        # the file/stdout writes so the input loop never blocks on log I/O
         self.log_file = Path(log_file)
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        formatter = CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(self.log_file)
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        # QueueHandler.prepare() still merges msg % args on the calling thread;
+        # timestamps, levels and the writes happen in the listener's handlers.
+        # Attached directly: basicConfig() would give it a second full formatter
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        self.log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+        self.log_listener.start()
+        # Flush queued records on any exit path (sys.exit in handlers included)
+        atexit.register(self.log_listener.stop)
         self.logger = logging.getLogger(__name__)
 
         self.max_duration = max_duration
@@ -50,20 +145,29 @@ class ScreenPulse:
 
         self.is_recording = False
         self.ffmpeg_process = None
-        self.last_mouse_time = time.time()
         self.recording_start_time = None
-        self.lock = Lock()
 
         self.current_filename = None
         self.notification_id = None  # Track notification for dismissal
 
-        self.logger.info("ScreenPulse initialized")
-        self.logger.info(f"Output directory: {self.output_dir.absolute()}")
-        self.logger.info(f"Log file: {self.log_file.absolute()}")
-        self.logger.info(f"Max recording duration: {max_duration // 60} minutes")
-        self.logger.info(f"Idle timeout: {idle_timeout // 60} minutes")
-        self.logger.info(f"Resolution: {resolution}")
-        self.logger.info(f"Quality (CRF): {crf}")
+        self.epoll = None  # Persistent epoll set for input devices (created in run)
+        self.devices = {}  # fd -> evdev.InputDevice registered with epoll
+        self.udev_monitor = None  # udev hot-plug notifications for input devices
+        # One-shot timers armed while recording; expiry stops the recording
+        self.max_timer_fd = timerfd_create()
+        self.idle_timer_fd = timerfd_create()
+
+        self.logger.info(
+            "ScreenPulse initialized\n"
+            "  Output directory: %s\n"
+            "  Log file: %s\n"
+            "  Max recording duration: %d minutes\n"
+            "  Idle timeout: %d minutes\n"
+            "  Resolution: %s\n"
+            "  Quality (CRF): %s",
+            self.output_dir.absolute(), self.log_file.absolute(),
+            max_duration // 60, idle_timeout // 60, resolution, crf
+        )
 
     def send_notification(self, message):
         """Send desktop notification"""
@@ -90,8 +194,7 @@ class ScreenPulse:
 
     def get_output_filename(self):
         """Generate timestamped filename"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return self.output_dir / f"recording_{timestamp}.mp4"
+        return self._out_prefix + datetime.now().strftime("%Y%m%d_%H%M%S") + '.mp4'
 
     def get_ffmpeg_command(self, output_file):
         """Build optimized ffmpeg command for small file size and good quality"""
@@ -104,7 +207,7 @@ class ScreenPulse:
             self.logger.info("Detected Wayland - using wf-recorder")
             return [
                 'wf-recorder',
-                '-f', str(output_file),
+                '-f', output_file,
                 '-c', 'libx264',  # Software encoding (h264_vaapi may fail)
                 '--pixel-format', 'yuv420p',
                 '-r', '30'  # 30 fps
@@ -124,116 +227,200 @@ class ScreenPulse:
                 '-movflags', '+faststart',  # Enable streaming
                 '-vf', f'scale={self.resolution}:flags=lanczos',  # High-quality scaling
                 '-y',  # Overwrite output file
-                str(output_file)
+                output_file
             ]
 
     def start_recording(self):
         """Start ffmpeg recording process"""
-        with self.lock:
-            if self.is_recording:
-                return
+        if self.is_recording:
+            return
 
-            self.current_filename = self.get_output_filename()
-            self.recording_start_time = time.time()
+        self.current_filename = self.get_output_filename()
+        self.recording_start_time = time.monotonic()
 
-            cmd = self.get_ffmpeg_command(self.current_filename)
+        cmd = self.get_ffmpeg_command(self.current_filename)
 
-            try:
-                # Start ffmpeg in background, suppress output
-                self.ffmpeg_process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    stdin=subprocess.PIPE
-                )
-                self.is_recording = True
-                self.logger.info(f"▶ Recording started: {self.current_filename.name}")
-                # Show red dot notification
-                self.send_notification("🔴")
-            except FileNotFoundError as e:
-                self.logger.error(f"Recording tool not found. Please install ffmpeg or wf-recorder")
-                self.logger.error(f"Details: {e}")
-            except Exception as e:
-                self.logger.error(f"Error starting recording: {e}")
+        try:
+            # Start ffmpeg in background, suppress output. It gets its own
+            # session so a terminal Ctrl+C reaches only us: stop_recording's
+            # SIGINT must be the recorder's only one, a second aborts the
+            # moov/faststart write. close_fds=False skips the close loop up
+            # to the fd limit; every fd we own (evdev, epoll, timerfd, udev,
+            # log) is CLOEXEC.
+            self.ffmpeg_process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                stdin=subprocess.DEVNULL,
+                close_fds=False,
+                start_new_session=True
+            )
+            self.is_recording = True
+            timerfd_settime(self.max_timer_fd, self.max_duration)
+            timerfd_settime(self.idle_timer_fd, self.idle_timeout)
+            self.logger.info(f"▶ Recording started: {os.path.basename(self.current_filename)}")
+            # Show red dot notification
+            self.send_notification("🔴")
+        except FileNotFoundError as e:
+            self.logger.error(f"Recording tool not found. Please install ffmpeg or wf-recorder")
+            self.logger.error(f"Details: {e}")
+        except Exception as e:
+            self.logger.error(f"Error starting recording: {e}")
 
     def stop_recording(self):
         """Stop current recording"""
-        with self.lock:
-            if not self.is_recording:
-                return
+        if not self.is_recording:
+            return
 
-            if self.ffmpeg_process:
-                # Send 'q' to ffmpeg for graceful shutdown
-                try:
-                    self.ffmpeg_process.communicate(input=b'q', timeout=5)
-                except subprocess.TimeoutExpired:
-                    self.ffmpeg_process.terminate()
-                    self.ffmpeg_process.wait(timeout=5)
-                except:
-                    pass
+        # Disarm both limits; they are re-armed by the next start_recording
+        timerfd_settime(self.max_timer_fd, 0)
+        timerfd_settime(self.idle_timer_fd, 0)
 
-                self.ffmpeg_process = None
+        if self.ffmpeg_process:
+            # One SIGINT makes ffmpeg/wf-recorder finalize the file and exit;
+            # a second one would abort immediately and lose the moov atom
+            try:
+                self.ffmpeg_process.send_signal(signal.SIGINT)
+                self.ffmpeg_process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.ffmpeg_process.terminate()
+                self.ffmpeg_process.wait(timeout=5)
+            except:
+                pass
 
-            duration = int(time.time() - self.recording_start_time)
-            self.is_recording = False
+            self.ffmpeg_process = None
 
-            # Dismiss notification
-            self.dismiss_notification()
+        duration = int(time.monotonic() - self.recording_start_time)
+        self.is_recording = False
 
-            # Get file size
-            if self.current_filename.exists():
-                size_mb = self.current_filename.stat().st_size / (1024 * 1024)
-                self.logger.info(f"■ Recording stopped: {self.current_filename.name}")
-                self.logger.info(f"  Duration: {duration // 60}m {duration % 60}s | Size: {size_mb:.1f} MB")
-            else:
-                self.logger.warning(f"■ Recording stopped (file not created)")
+        # Dismiss notification
+        self.dismiss_notification()
+
+        # Get file size
+        try:
+            size_mb = os.stat(self.current_filename).st_size / (1024 * 1024)
+        except FileNotFoundError:
+            self.logger.warning(f"■ Recording stopped (file not created)")
+        else:
+            self.logger.info("■ Recording stopped: %s | Duration: %dm %ds | Size: %.1f MB",
+                             os.path.basename(self.current_filename), duration // 60, duration % 60, size_mb)
+
+    def open_input_device(self, device_path):
+        """Open an input device if it can trigger recording, else return None"""
+        device = None
+        try:
+            device = evdev.InputDevice(device_path)
+            # Reject known non-user devices before any capability ioctls
+            if _IGNORED_DEVICE_NAMES.search(device.name):
+                self.logger.debug(f"Skipping device: {device.name} ({device_path})")
+                device.close()
+                return None
+            # Only include devices that have mouse or keyboard capabilities;
+            # skip the verbose name mapping and ABS info, only the types matter
+            caps = device.capabilities(verbose=False, absinfo=False)
+            if evdev.ecodes.EV_REL in caps or evdev.ecodes.EV_KEY in caps:
+                # Drop EV_MSC/EV_ABS/... in the kernel rather than in the read loop
+                try:
+                    set_event_type_mask(device, (evdev.ecodes.EV_REL, evdev.ecodes.EV_KEY))
+                except OSError as e:
+                    self.logger.debug(f"EVIOCSMASK unsupported for {device_path}: {e}")
+                self.logger.debug(f"Monitoring device: {device.name} ({device_path})")
+                return device
+        except Exception as e:
+            self.logger.warning(f"Could not access {device_path}: {e}")
+        # Don't leak fds for devices we won't watch
+        if device is not None:
+            try:
+                device.close()
+            except Exception:
+                pass
+        return None
 
     def get_input_devices(self):
         """Get all input devices that can trigger recording"""
         devices = []
         try:
             for device_path in evdev.list_devices():
-                try:
-                    device = evdev.InputDevice(device_path)
-                    # Only include devices that have mouse or keyboard capabilities
-                    caps = device.capabilities()
-                    if evdev.ecodes.EV_REL in caps or evdev.ecodes.EV_KEY in caps:
-                        devices.append(device)
-                        self.logger.debug(f"Monitoring device: {device.name} ({device_path})")
-                except Exception as e:
-                    self.logger.warning(f"Could not access {device_path}: {e}")
+                device = self.open_input_device(device_path)
+                if device is not None:
+                    devices.append(device)
         except Exception as e:
             self.logger.error(f"Error listing input devices: {e}")
         return devices
 
-    def on_input_activity(self):
-        """Handle input activity (mouse/keyboard)"""
-        self.last_mouse_time = time.time()
+    def add_device(self, device):
+        """Start watching an opened input device"""
+        self.epoll.register(device.fd, select.EPOLLIN)
+        self.devices[device.fd] = device
 
-        # Start recording if not already recording
-        if not self.is_recording:
-            self.start_recording()
+    def remove_device(self, fd):
+        """Stop watching an input device and close it"""
+        device = self.devices.pop(fd, None)
+        if device is None:
+            return
+        try:
+            self.epoll.unregister(fd)
+        except OSError:
+            pass
+        try:
+            device.close()
+        except Exception:
+            pass
 
-    def monitor_recording(self):
-        """Monitor recording duration and idle time"""
+    def handle_udev_events(self):
+        """Add or remove the single device named by each pending udev event"""
         while True:
-            time.sleep(1)
+            udev_device = self.udev_monitor.poll(timeout=0)
+            if udev_device is None:
+                return
 
-            if self.is_recording:
-                current_time = time.time()
-                recording_duration = current_time - self.recording_start_time
-                idle_duration = current_time - self.last_mouse_time
+            device_node = udev_device.device_node
+            if not device_node or not os.path.basename(device_node).startswith('event'):
+                continue
+
+            if udev_device.action == 'add':
+                # The monitor starts before enumeration, so a node may already be open
+                if any(device.path == device_node for device in self.devices.values()):
+                    continue
+                device = self.open_input_device(device_node)
+                if device is not None:
+                    self.add_device(device)
+                    self.logger.info(f"Device connected: {device.name}")
+                    self.logger.info(f"Now monitoring {len(self.devices)} input device(s)")
+            elif udev_device.action == 'remove':
+                for fd, device in list(self.devices.items()):
+                    if device.path == device_node:
+                        self.logger.info(f"Device removed: {device.name}")
+                        self.remove_device(fd)
+                        self.logger.info(f"Now monitoring {len(self.devices)} input device(s)")
 
-                # Check if max duration reached
-                if recording_duration >= self.max_duration:
-                    self.logger.info(f"Max duration ({self.max_duration // 60} min) reached")
-                    self.stop_recording()
-                    # Recording will auto-restart on next mouse movement
+    def on_input_activity(self):
+        """Handle input activity (mouse/keyboard)"""
+        # Input, timers and signals are all handled on the loop thread,
+        # so is_recording needs no lock
+        if self.is_recording:
+            # Push the idle deadline out again (one syscall)
+            timerfd_settime(self.idle_timer_fd, self.idle_timeout)
+        else:
+            self.start_recording()
 
-                # Check if idle timeout reached
-                elif idle_duration >= self.idle_timeout:
-                    self.logger.info(f"Idle timeout ({self.idle_timeout // 60} min) reached")
-                    self.stop_recording()
+    def on_timer_expired(self, fd):
+        """Stop recording when the max-duration or idle timer fires"""
+        # Clear the expiration count; EAGAIN means the timer was re-armed or
+        # disarmed after epoll reported it (e.g. both limits fired together)
+        try:
+            os.read(fd, 8)
+        except BlockingIOError:
+            return
+        if not self.is_recording:
+            return
+
+        if fd == self.max_timer_fd:
+            self.logger.info(f"Max duration ({self.max_duration // 60} min) reached")
+            # Recording will auto-restart on next mouse movement
+        else:
+            self.logger.info(f"Idle timeout ({self.idle_timeout // 60} min) reached")
+        self.stop_recording()
 
     def run(self):
         """Main run loop"""
@@ -245,75 +432,107 @@ class ScreenPulse:
             self.logger.info("Move your mouse or press any key to start recording...")
         self.logger.info("="*60)
 
-        # Get input devices
-        devices = self.get_input_devices()
-        if not devices:
+        # Devices that reconnect or wake from sleep are announced by udev,
+        # so they are picked up individually instead of by re-scanning.
+        # Listen before enumerating so a device plugged in meanwhile isn't missed
+        self.epoll = select.epoll()
+        self.udev_monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        self.udev_monitor.filter_by('input')
+        self.udev_monitor.start()
+        udev_fd = self.udev_monitor.fileno()
+        self.epoll.register(udev_fd, select.EPOLLIN)
+
+        # Get input devices and register them with the same epoll set
+        for device in self.get_input_devices():
+            self.add_device(device)
+        if not self.devices:
             self.logger.error("No input devices found! Make sure you're in the 'input' group.")
             self.logger.error("Run: sudo usermod -aG input $USER")
             sys.exit(1)
 
-        self.logger.info(f"Monitoring {len(devices)} input device(s)")
+        self.logger.info(f"Monitoring {len(self.devices)} input device(s)")
 
-        # Start monitoring thread
-        monitor_thread = Thread(target=self.monitor_recording, daemon=True)
-        monitor_thread.start()
+        # Duration/idle limits are one-shot timerfds in the same epoll set;
+        # nothing wakes up while the user is active or nothing is recording
+        timer_fds = (self.max_timer_fd, self.idle_timer_fd)
+        for timer_fd in timer_fds:
+            self.epoll.register(timer_fd, select.EPOLLIN)
 
         # Auto-start recording if enabled
         if self.auto_start:
             self.start_recording()
 
-        # Track last device refresh time for periodic re-detection
-        last_device_refresh = time.time()
-        device_refresh_interval = 30  # Refresh every 30 seconds to catch sleeping devices
+        # Bind hot-loop lookups once
+        EV_REL = evdev.ecodes.EV_REL
+        EV_KEY = evdev.ecodes.EV_KEY
+        _activity = self.on_input_activity
+
+        # SIGINT/SIGTERM/SIGHUP only wake the loop through the wakeup fd; shutdown
+        # runs from the loop, never re-entrantly inside a signal handler
+        # (which could interrupt stop_recording's wait for the recorder).
+        # SIGHUP is included: the recorder has its own session and won't see
+        # the terminal hang up, so we must stop it rather than die and orphan it
+        signal_r, signal_w = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        signal.set_wakeup_fd(signal_w, warn_on_full_buffer=False)
+        for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+            signal.signal(signum, lambda signum, frame: None)
+        self.epoll.register(signal_r, select.EPOLLIN)
 
         # Monitor input devices using evdev
+        running = True
         try:
-            while True:
-                # Periodically refresh device list to catch devices that reconnect/wake from sleep
-                current_time = time.time()
-                if current_time - last_device_refresh >= device_refresh_interval:
-                    old_count = len(devices)
-                    devices = self.get_input_devices()
-                    new_count = len(devices)
-                    last_device_refresh = current_time
-
-                    if new_count != old_count:
-                        self.logger.info(f"Device change detected: {old_count} → {new_count} devices")
-                        self.logger.info(f"Now monitoring {new_count} input device(s)")
-
-                # Use select to wait for events on any device
-                r, w, x = select.select(devices, [], [], 1.0)
-                for device in r:
+            while running:
+                # Wait for events; epoll only returns the fds that are ready
+                for fd, _ in self.epoll.poll():
+                    if fd == signal_r:
+                        # Drain the signal numbers written by the C-level handler
+                        os.read(signal_r, 64)
+                        running = False
+                        break
+                    if fd in timer_fds:
+                        self.on_timer_expired(fd)
+                        continue
+                    if fd == udev_fd:
+                        self.handle_udev_events()
+                        continue
+
+                    device = self.devices.get(fd)
+                    if device is None:
+                        continue
                     try:
-                        for event in device.read():
-                            # Detect mouse movement or keyboard activity
-                            if event.type in (evdev.ecodes.EV_REL, evdev.ecodes.EV_KEY):
-                                self.on_input_activity()
+                        # One activity update per read() burst, not per event
+                        if any(event.type == EV_REL or event.type == EV_KEY
+                               for event in device.read()):
+                            _activity()
                     except OSError as e:
-                        # Device was disconnected, refresh device list immediately
+                        # Device was disconnected; udev announces it if it comes back
                         self.logger.warning(f"Device disconnected: {device.name}")
-                        old_count = len(devices)
-                        devices = self.get_input_devices()
-                        new_count = len(devices)
-                        self.logger.info(f"Refreshed devices: {old_count} → {new_count}")
-                        last_device_refresh = current_time  # Reset refresh timer
-                        break
-        except KeyboardInterrupt:
+                        self.remove_device(fd)
+                        self.logger.info(f"Now monitoring {len(self.devices)} input device(s)")
+
             self.logger.info("Shutting down...")
             self.stop_recording()
             self.logger.info("ScreenPulse stopped.")
-            sys.exit(0)
         except Exception as e:
             self.logger.error(f"Error in input monitoring: {e}")
             self.stop_recording()
             sys.exit(1)
         finally:
             # Close all devices
-            for device in devices:
+            for device in self.devices.values():
                 try:
                     device.close()
                 except:
                     pass
+            for timer_fd in (self.max_timer_fd, self.idle_timer_fd):
+                os.close(timer_fd)
+            # pyudev has no close(); dropping the last reference unrefs the
+            # libudev monitor, which closes its netlink socket
+            self.udev_monitor = None
+            self.epoll.close()
+            signal.set_wakeup_fd(-1)
+            os.close(signal_r)
+            os.close(signal_w)
 
 def daemonize(pid_file):
     """Daemonize the process"""
@@ -385,7 +604,6 @@ def main():
     if args.daemon:
         daemonize(args.pid_file)
 
-    # Handle Ctrl+C gracefully
     recorder = ScreenPulse(
         output_dir=args.output_dir,
         log_file=args.log_file,
@@ -396,16 +614,8 @@ def main():
         auto_start=args.auto_start
     )
 
-    def signal_handler(sig, frame):
-        recorder.logger.info("Shutting down...")
-        recorder.stop_recording()
-        # Clean up PID file if in daemon mode
-        if args.daemon and os.path.exists(args.pid_file):
-            os.remove(args.pid_file)
-        sys.exit(0)
-
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # SIGINT/SIGTERM/SIGHUP are handled inside run(); the daemon's PID file is
+    # removed by its atexit hook
     recorder.run()
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ pkgs.mkShell {
     python311
     python311Packages.pynput
     python311Packages.evdev
+    python311Packages.pyudev
   ];
 
   shellHook = ''
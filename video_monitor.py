@@ -1,15 +1,28 @@
 """File system monitor for detecting new videos."""
 import logging
+import os
+import sys
 import time
 from pathlib import Path
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
 import config
 
+try:
+    from inotify_simple import INotify, flags
+except ImportError:  # fall back to polling the directory
+    INotify = None
+
 logger = logging.getLogger(__name__)
 
+# Seconds to remember a MOVED_FROM cookie; the matching MOVED_TO of a rename
+# follows immediately, so this only bounds cookies of files moved out
+_RENAME_COOKIE_TTL = 5.0
+
+# Seconds after which a file's debounce stamp is forgotten; far longer than
+# STABLE_WAIT_TIME, it only bounds memory in long-running monitors
+_LAST_SEEN_TTL = 3000
+
 
-class VideoHandler(FileSystemEventHandler):
+class VideoHandler:
     """Handles file system events for video files."""
 
     def __init__(self, callback):
@@ -21,108 +34,70 @@ class VideoHandler(FileSystemEventHandler):
                      Should accept a Path object as argument.
         """
         self.callback = callback
-        self.processing = set()  # Track files being processed
-
-    def on_created(self, event):
-        """Handle file creation events."""
-        if event.is_directory:
-            return
-
-        file_path = Path(event.src_path)
-        self._process_video_file(file_path, "created")
-
-    def on_modified(self, event):
-        """Handle file modification events."""
-        if event.is_directory:
-            return
-
-        file_path = Path(event.src_path)
-        self._process_video_file(file_path, "modified")
-
-    def _process_video_file(self, file_path: Path, event_type: str):
+        # Keyed by interned path strings: cheaper to hash than Path objects,
+        # and ignored events never allocate a Path at all. Events are handled
+        # one at a time on the monitor loop and the callback runs inline, so
+        # no "being processed" tracking is needed.
+        self._last_seen: dict[str, float] = {}  # Last event time per file, for debouncing
+
+    def on_created(self, src_path: str):
+        """Handle file creation events (recording started)."""
+        if src_path.lower().endswith(config.SUPPORTED_SUFFIXES_TUPLE):
+            logger.debug("Recording started: %s", src_path)
+
+    def on_closed(self, src_path: str):
+        """Handle close-after-write events (recording finished)."""
+        self._process_video_file(src_path, "closed")
+
+    def _process_video_file(self, src_path: str, event_type: str):
         """Process a video file event."""
         # Check if it's a supported video format
-        if file_path.suffix.lower() not in config.SUPPORTED_FORMATS:
-            logger.debug(f"Ignoring non-video file: {file_path.name}")
+        if not src_path.lower().endswith(config.SUPPORTED_SUFFIXES_TUPLE):
+            logger.debug("Ignoring non-video file: %s", src_path)
             return
 
-        # Avoid processing the same file multiple times
-        if file_path in self.processing:
-            logger.debug(f"Already processing: {file_path.name}")
-            return
+        key = sys.intern(src_path)
 
-        logger.info(f"Video {event_type}: {file_path.name}")
+        # Debounce repeated closes of the same file (e.g. a copy followed by a touch)
+        now = time.monotonic()
+        last_seen = self._last_seen.get(key, 0.0)
+        self._last_seen[key] = now
+        if now - last_seen < config.STABLE_WAIT_TIME:
+            logger.debug("Debounced %s event: %s", event_type, src_path)
+            return
 
-        # Wait for file to be fully written
+        # CLOSE_WRITE fires once the writer is done, so one stat is enough
         try:
-            self._wait_for_stable_file(file_path)
-        except TimeoutError as e:
-            logger.error(f"Timeout waiting for file to stabilize: {e}")
-            logger.info(f"Skipping {file_path.name} - will be picked up by next scan")
+            size = os.stat(src_path).st_size
+        except FileNotFoundError:
+            logger.warning("File disappeared: %s", src_path)
+            return
+        if size < config.MIN_FILE_SIZE:
+            logger.debug("File too small: %d bytes (min %d)", size, config.MIN_FILE_SIZE)
             return
 
-        # Mark as processing
-        self.processing.add(file_path)
+        file_path = Path(src_path)
+        logger.info("Recording complete: %s (%d bytes)", file_path.name, size)
 
         try:
             # Call the callback with the video path
             self.callback(file_path)
         except Exception as e:
-            logger.error(f"Error processing {file_path.name}: {e}")
+            logger.error("Error processing %s: %s", file_path.name, e)
         finally:
-            # Remove from processing set
-            self.processing.discard(file_path)
-
-    def _wait_for_stable_file(self, file_path: Path, timeout: int = 3000):
-        """
-        Wait for file to finish being written (recording stopped).
-
-        Args:
-            file_path: Path to the file
-            timeout: Maximum seconds to wait (default: 3000s = 50 minutes)
-
-        Raises:
-            TimeoutError: If file doesn't stabilize within timeout
-        """
-        logger.debug(f"Waiting for recording to complete: {file_path.name}")
+            # Events queued while we were busy are debounced
+            self._last_seen[key] = time.monotonic()
+            self._prune(self._last_seen[key])
 
-        start_time = time.time()
-        stable_count = 0
-        last_size = -1
+    def _prune(self, now: float):
+        """Drop debounce stamps older than _LAST_SEEN_TTL."""
+        stale = [key for key, stamp in self._last_seen.items() if now - stamp >= _LAST_SEEN_TTL]
+        for key in stale:
+            del self._last_seen[key]
 
-        while time.time() - start_time < timeout:
-            try:
-                current_size = file_path.stat().st_size
-
-                # Check if file size is stable
-                if current_size == last_size:
-                    if current_size >= config.MIN_FILE_SIZE:
-                        stable_count += 1
-                        logger.debug(f"Stable check {stable_count}/{config.STABILITY_CHECKS} - Size: {current_size:,} bytes")
-
-                        # File must be stable for multiple consecutive checks
-                        if stable_count >= config.STABILITY_CHECKS:
-                            logger.info(f"Recording complete: {file_path.name} ({current_size:,} bytes)")
-                            return
-                    else:
-                        logger.debug(f"File too small: {current_size} bytes (min {config.MIN_FILE_SIZE})")
-                else:
-                    # Size changed - recording still in progress
-                    if stable_count > 0:
-                        logger.debug(f"Recording in progress... {current_size:,} bytes")
-                    stable_count = 0
-
-                last_size = current_size
-                time.sleep(config.STABLE_WAIT_TIME)
-
-            except FileNotFoundError:
-                logger.warning(f"File disappeared: {file_path.name}")
-                raise
-            except Exception as e:
-                logger.error(f"Error checking file: {e}")
-                raise
-
-        raise TimeoutError(f"Recording did not complete within {timeout}s: {file_path.name}")
+    def clear(self):
+        """Forget all tracked files."""
+        self._last_seen.clear()
 
 
 class VideoMonitor:
@@ -136,32 +111,108 @@ class VideoMonitor:
             callback: Function to call when a new video is detected
         """
         self.callback = callback
-        self.observer = None
+        self.inotify = None
         self.handler = VideoHandler(callback)
+        # Polling fallback state: path -> (last size, consecutive stable scans)
+        self._sizes: dict[str, tuple[int, int]] = {}
+        self._finished: set[str] = set()
+        # MOVED_FROM cookie -> time seen, to tell renames from files moved in
+        self._moved_from: dict[int, float] = {}
 
     def start(self):
         """Start monitoring the videos directory."""
-        logger.info(f"Starting video monitor on: {config.VIDEOS_DIR}")
-
-        # Create observer
-        self.observer = Observer()
-        self.observer.schedule(
-            self.handler,
-            str(config.VIDEOS_DIR),
-            recursive=False
-        )
-
-        # Start observer
-        self.observer.start()
+        logger.info("Starting video monitor on: %s", config.VIDEOS_DIR)
+        config.ensure_dirs()
+
+        # Watch for new files, writers closing them, and finished files moved
+        # in with mv on the same filesystem (those only produce MOVED_TO).
+        # MOVED_FROM pairs up renames inside the directory so they are ignored
+        self.watch_dir = str(config.VIDEOS_DIR)
+        if INotify is not None:
+            try:
+                self.inotify = INotify()
+                self.inotify.add_watch(self.watch_dir, flags.CREATE | flags.CLOSE_WRITE | flags.MOVED_TO | flags.MOVED_FROM)
+            except OSError as e:
+                logger.warning("inotify unavailable (%s), polling for stable files instead", e)
+                if self.inotify:
+                    self.inotify.close()
+                self.inotify = None
+        else:
+            logger.warning("inotify_simple not installed, polling for stable files instead")
+
+        if self.inotify is None:
+            # Only files that appear after startup are picked up, as with inotify
+            self._finished = {entry.path for entry in os.scandir(self.watch_dir)}
         logger.info("Video monitor started successfully")
 
     def stop(self):
         """Stop monitoring."""
-        if self.observer:
-            logger.info("Stopping video monitor...")
-            self.observer.stop()
-            self.observer.join()
-            logger.info("Video monitor stopped")
+        logger.info("Stopping video monitor...")
+        if self.inotify:
+            self.inotify.close()
+            self.inotify = None
+        self.handler.clear()
+        self._sizes.clear()
+        self._finished.clear()
+        self._moved_from.clear()
+        logger.info("Video monitor stopped")
+
+    def _dispatch(self, event):
+        """Route one inotify event to the handler."""
+        if event.mask & flags.ISDIR or not event.name:
+            return
+
+        if event.mask & flags.MOVED_FROM:
+            now = time.monotonic()
+            self._moved_from = {cookie: seen for cookie, seen in self._moved_from.items()
+                                if now - seen < _RENAME_COOKIE_TTL}
+            self._moved_from[event.cookie] = now
+            return
+        if event.mask & flags.MOVED_TO and self._moved_from.pop(event.cookie, None) is not None:
+            # Renamed within the directory, e.g. an already summarised recording
+            logger.debug("Ignoring rename to: %s", event.name)
+            return
+
+        src_path = os.path.join(self.watch_dir, event.name)
+        if event.mask & (flags.CLOSE_WRITE | flags.MOVED_TO):
+            self.handler.on_closed(src_path)
+        elif event.mask & flags.CREATE:
+            self.handler.on_created(src_path)
+
+    def _scan_for_stable_files(self):
+        """
+        Polling fallback: stat every video in one directory pass and report
+        files whose size held still for STABILITY_CHECKS consecutive scans.
+        """
+        sizes = {}
+        for entry in os.scandir(self.watch_dir):
+            src_path = entry.path
+            if src_path in self._finished or not entry.is_file():
+                continue
+            if not src_path.lower().endswith(config.SUPPORTED_SUFFIXES_TUPLE):
+                continue
+
+            try:
+                current_size = entry.stat().st_size
+            except FileNotFoundError:
+                continue
+
+            last_size, stable_count = self._sizes.get(src_path, (-1, 0))
+            if last_size == -1:
+                self.handler.on_created(src_path)
+            if current_size == last_size and current_size >= config.MIN_FILE_SIZE:
+                stable_count += 1
+            else:
+                stable_count = 0
+
+            if stable_count >= config.STABILITY_CHECKS:
+                self._finished.add(src_path)
+                self.handler.on_closed(src_path)
+            else:
+                sizes[src_path] = (current_size, stable_count)
+
+        # Drops files that disappeared or finished
+        self._sizes = sizes
 
     def run(self):
         """Run the monitor (blocking)."""
@@ -169,7 +220,14 @@ class VideoMonitor:
         try:
             logger.info("Monitoring for new videos... Press Ctrl+C to stop")
             while True:
-                time.sleep(1)
+                if self.inotify is None:
+                    self._scan_for_stable_files()
+                    time.sleep(config.STABLE_WAIT_TIME)
+                    continue
+
+                # Blocks in the kernel until events arrive
+                for event in self.inotify.read():
+                    self._dispatch(event)
         except KeyboardInterrupt:
             logger.info("Received shutdown signal")
         finally: